@@ -1,10 +1,21 @@
+import atexit
+import bisect
+import functools
+import json
 import os
 import re
+import statistics
+import sys
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
 
 try:
     import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles.borders import DEFAULT_BORDER
+    from openpyxl.styles.fonts import DEFAULT_FONT
     from openpyxl.utils import get_column_letter
 
     EXCEL_AVAILABLE = True
@@ -14,6 +25,174 @@ except ImportError:
     print("Please install it: pip install openpyxl")
     exit()
 
+# Precompiled patterns for height and phone parsing
+_NUMS = re.compile(r"\d+\.?\d*")
+_NONDIGIT = re.compile(r"\D")
+
+# Lower bounds of each BMI / blood sugar band, paired with one label per band
+_BMI_THRESH = (16.0, 18.5, 25.0, 30.0, 35.0, 40.0)
+_BMI_LABELS = (
+    "Severely Underweight",
+    "Underweight",
+    "Normal",
+    "Overweight",
+    "Obese Class I",
+    "Obese Class II",
+    "Obese Class III",
+)
+_BMI_HEALTH_LABELS = (
+    "🚨 SEVERELY UNDERWEIGHT - Nutritional support needed",
+    "⚠️ UNDERWEIGHT - Increase caloric intake",
+    "✅ HEALTHY WEIGHT - Maintain current lifestyle",
+    "⚡ OVERWEIGHT - Diet and exercise recommended",
+    "⚠️ OBESE - Medical consultation advised",
+    "🚨 SEVERELY OBESE - Immediate medical attention",
+    "🚨 MORBIDLY OBESE - Urgent medical intervention",
+)
+_SUGAR_THRESH = (3.9, 5.6, 7.8, 11.1)
+_SUGAR_LABELS = (
+    "⚠️ LOW SUGAR - Hypoglycemia risk",
+    "✅ NORMAL SUGAR - Good glucose level",
+    "⚡ BORDERLINE - Monitor glucose levels",
+    "⚠️ HIGH SUGAR - Pre-diabetic range",
+    "🚨 VERY HIGH SUGAR - Diabetic range, see doctor",
+)
+
+# Lower bounds of the ranges the reports count as alerts
+_BP_CRISIS = (180, 120)
+_BP_HIGH = (140, 90)
+_HIGH_SUGAR = _SUGAR_THRESH[2]
+_OBESE_BMI = _BMI_THRESH[3]
+# Alert severity of each sugar/BMI range: 0 none, 1 medium, 2 high priority
+_SUGAR_SEVERITY = (2, 0, 0, 1, 2)
+_BMI_SEVERITY = (2, 0, 0, 0, 1, 2, 2)
+_BP_CRISIS_LABEL = "🚨 HYPERTENSIVE CRISIS - Emergency medical care needed"
+
+# Shared styles, reused so openpyxl doesn't rebuild them for every cell
+_HEADER_FONT = Font(bold=True, color="FFFFFF")
+_HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+_THIN = Side(style="thin")
+_BORDER = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+_CENTER = Alignment(horizontal="center", vertical="center")
+_ALT_FILL = PatternFill(start_color="F0F8FF", end_color="F0F8FF", fill_type="solid")
+
+# Alert and summary sheet palette, shared by every styled row
+_TITLE_FONT = Font(bold=True, size=16, color="FFFFFF")
+_SECTION_FONT = Font(bold=True, size=14, color="FFFFFF")
+_HEADING_FONT = Font(bold=True, size=12)
+_ALERT_HEADING_FONT = Font(bold=True, size=12, color="DC143C")
+_BOLD_FONT = Font(bold=True)
+_HIGH_FONT = Font(color="DC143C")
+_MEDIUM_FONT = Font(color="FF8C00")
+_HIGH_FILL = PatternFill(start_color="DC143C", end_color="DC143C", fill_type="solid")
+_HIGH_HEADER_FILL = PatternFill(
+    start_color="8B0000", end_color="8B0000", fill_type="solid"
+)
+_HIGH_ROW_FILL = PatternFill(
+    start_color="FFE4E1", end_color="FFE4E1", fill_type="solid"
+)
+_MEDIUM_FILL = PatternFill(start_color="FF8C00", end_color="FF8C00", fill_type="solid")
+_MEDIUM_HEADER_FILL = PatternFill(
+    start_color="FF6347", end_color="FF6347", fill_type="solid"
+)
+_MEDIUM_ROW_FILL = PatternFill(
+    start_color="FFF8DC", end_color="FFF8DC", fill_type="solid"
+)
+_TABLE_HEADER_FILL = PatternFill(
+    start_color="D3D3D3", end_color="D3D3D3", fill_type="solid"
+)
+
+# Named cell styles; assigning one by name sets the whole style in one step
+_HEADER_STYLE = "Camp Header"
+_DATA_STYLE = "Camp Data"
+_DATA_ALT_STYLE = "Camp Data Alternate"
+_HIGH_ROW_STYLE = "High Priority Row"
+_MEDIUM_ROW_STYLE = "Medium Priority Row"
+
+
+def _fmt_num(value):
+    """Format a measurement to one decimal, dropping a trailing .0"""
+    return f"{value:.1f}".rstrip("0").rstrip(".")
+
+
+def _parse_bp(bp_str):
+    """Return (systolic, diastolic) from a 'systolic/diastolic' string, or None"""
+    if not bp_str or "/" not in bp_str:
+        return None
+    try:
+        systolic, diastolic = bp_str.split("/")
+        return int(systolic.strip()), int(diastolic.strip())
+    except ValueError:
+        return None
+
+
+def _parse_float(value):
+    """Return value as a float, or None if it is blank or not a number"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _analyze_patient(patient, bp, sugar, bmi):
+    """Return (severity, alert) for a patient and their parsed vitals, or None"""
+    alerts = []
+    severity = 0
+
+    # Check blood pressure
+    if bp is not None and (bp[0] >= _BP_CRISIS[0] or bp[1] >= _BP_CRISIS[1]):
+        alerts.append(_BP_CRISIS_LABEL)
+        severity = 2
+
+    # Check blood sugar
+    if sugar is not None:
+        level = bisect.bisect_right(_SUGAR_THRESH, sugar)
+        if _SUGAR_SEVERITY[level]:
+            alerts.append(_SUGAR_LABELS[level])
+            severity = max(severity, _SUGAR_SEVERITY[level])
+
+    # Check BMI
+    if bmi is not None:
+        level = bisect.bisect_right(_BMI_THRESH, bmi)
+        if _BMI_SEVERITY[level]:
+            alerts.append(_BMI_HEALTH_LABELS[level])
+            severity = max(severity, _BMI_SEVERITY[level])
+
+    if not alerts:
+        return None
+    return severity, {
+        "name": patient["Name"],
+        "age": patient["Age"],
+        "gender": patient["Gender"],
+        "phone": patient.get("Phone", ""),
+        "alerts": " | ".join(alerts),
+        "priority": "HIGH" if severity == 2 else "MEDIUM",
+    }
+
+
+@dataclass
+class SummaryStats:
+    """Figures shared by the summary sheet and the printed summary report"""
+
+    n: int
+    male_count: int
+    female_count: int
+    ages: list
+    blood_groups: Counter
+    tested_for_blood_group: int
+    bmi_counts: list
+    bmi_values: list
+    measured_count: int
+    sugar_tested: int
+    bp_tested: int
+    phone_provided: int
+    high_bp: int
+    high_sugar: int
+    obese: int
+    crisis_bp: int
+
 
 class MedicalCampDataEntry:
     def __init__(self, filename="medical_camp_data.xlsx"):
@@ -33,43 +212,56 @@ class MedicalCampDataEntry:
             "Health Comments",
             "Date Added",
         ]
-        self.data = []
+        self._empty_row = {column: "" for column in self.columns}
+        # Records added since the last Excel export, one JSON object per line
+        self._log_path = filename + ".jsonl"
+        self._reset_records()
         self.load_existing_data()
+        atexit.register(self._save_pending)
 
     def load_existing_data(self):
         """Load existing data from Excel file if it exists"""
         if os.path.exists(self.filename):
             try:
-                wb = openpyxl.load_workbook(self.filename)
-                ws = wb.active
-
-                # Read header row to get column mapping
-                headers = []
-                for col in range(1, ws.max_column + 1):
-                    header_cell = ws.cell(row=1, column=col)
-                    if header_cell.value:
-                        headers.append(str(header_cell.value))
-                    else:
-                        break
-
-                # Read data rows
-                for row in range(2, ws.max_row + 1):
-                    patient = {}
-                    has_data = False
-
-                    for col, header in enumerate(headers, 1):
-                        cell_value = ws.cell(row=row, column=col).value
-                        if cell_value is not None:
-                            patient[header] = str(cell_value)
-                            has_data = True
+                # Stream the sheet instead of building the full cell model
+                wb = openpyxl.load_workbook(
+                    self.filename, read_only=True, data_only=True
+                )
+                try:
+                    ws = wb.active
+                    # Don't trust the stored <dimension>: it can be missing or
+                    # stale, and iter_rows would pad or truncate rows to it
+                    ws.reset_dimensions()
+                    rows = ws.iter_rows(values_only=True)
+
+                    # Read header row to get column mapping
+                    headers = []
+                    for value in next(rows, ()):
+                        if value:
+                            headers.append(str(value))
                         else:
-                            patient[header] = ""
-
-                    # Only add row if it has some data
-                    if has_data and patient.get("Name", "").strip():
-                        self.data.append(patient)
-
-                wb.close()
+                            break
+
+                    # Every record starts from a blank copy of all known columns
+                    empty_row = {**self._empty_row, **dict.fromkeys(headers, "")}
+
+                    # Read data rows, skipping unnamed ones before building a record
+                    name_col = headers.index("Name") if "Name" in headers else None
+                    for values in rows:
+                        if name_col is None or name_col >= len(values):
+                            continue
+                        name = values[name_col]
+                        if name is None or not str(name).strip():
+                            continue
+
+                        patient = empty_row.copy()
+                        for header, cell_value in zip(headers, values):
+                            if cell_value is not None:
+                                patient[header] = str(cell_value)
+
+                        self._append_record(patient)
+                finally:
+                    wb.close()
                 print(
                     f"✅ Loaded {len(self.data)} existing records from {self.filename}"
                 )
@@ -77,10 +269,75 @@ class MedicalCampDataEntry:
             except Exception as e:
                 print(f"⚠️  Could not load existing Excel file: {e}")
                 print("Creating new data set...")
-                self.data = []
+                self._reset_records()
         else:
             print(f"📝 Creating new Excel file: {self.filename}")
 
+        self._load_log()
+
+    def _load_log(self):
+        """Load records that were logged but not yet exported to Excel"""
+        if not os.path.isfile(self._log_path):
+            return
+
+        recovered = 0
+        try:
+            with open(self._log_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        patient = json.loads(line)
+                    except ValueError:
+                        continue  # Line cut short by an interrupted write
+
+                    self._append_record(patient)
+                    recovered += 1
+        except OSError as e:
+            print(f"❌ Error reading record log: {e}")
+        else:
+            print(f"♻️  Recovered {recovered} unsaved records from {self._log_path}")
+
+    def _log_record(self, patient):
+        """Append one patient record to the log file"""
+        with open(self._log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(patient, ensure_ascii=False) + "\n")
+
+    def _save_pending(self):
+        """Export to Excel at shutdown if records were logged since the last save"""
+        if os.path.isfile(self._log_path):
+            self.save_to_excel()
+
+    def _reset_records(self):
+        """Start with an empty patient list and empty per-column lists"""
+        self.data = []
+        self.columns_data = {column: [] for column in self.columns}
+        self._summary_cache = None
+        # Lowercased copies of the columns searched by substring
+        self._name_lower = []
+        self._health_lower = []
+        # Numeric ages of the patients whose age is a plain number
+        self._ages = []
+        self._is_male = []
+        # Parsed vitals per record (None when missing or unreadable)
+        self._bp = []
+        self._sugar = []
+        self._bmi = []
+
+    def _append_record(self, patient):
+        """Add a patient to the row list and to the per-column lists"""
+        self.data.append(patient)
+        self._summary_cache = None
+        for column, values in self.columns_data.items():
+            values.append(patient.get(column, ""))
+        self._name_lower.append(patient.get("Name", "").lower())
+        self._health_lower.append(patient.get("Health Comments", "").lower())
+        age = str(patient.get("Age", ""))
+        if age.isdigit():
+            self._ages.append(int(age))
+        self._is_male.append(patient.get("Gender", "").lower() == "male")
+        self._bp.append(_parse_bp(patient.get("Blood Pressure", "")))
+        self._sugar.append(_parse_float(patient.get("Blood Sugar", "")))
+        self._bmi.append(_parse_float(patient.get("BMI", "")))
+
     def calculate_bmi(self, weight, height_cm):
         """Calculate BMI from weight (kg) and height (cm)"""
         try:
@@ -92,24 +349,12 @@ class MedicalCampDataEntry:
         except (ValueError, ZeroDivisionError):
             return ""
 
-    def categorize_bmi(self, bmi):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def categorize_bmi(bmi):
         """Categorize BMI with detailed classification"""
         try:
-            bmi_val = float(bmi)
-            if bmi_val < 16:
-                return "Severely Underweight"
-            elif 16 <= bmi_val < 18.5:
-                return "Underweight"
-            elif 18.5 <= bmi_val < 25:
-                return "Normal"
-            elif 25 <= bmi_val < 30:
-                return "Overweight"
-            elif 30 <= bmi_val < 35:
-                return "Obese Class I"
-            elif 35 <= bmi_val < 40:
-                return "Obese Class II"
-            else:
-                return "Obese Class III"
+            return _BMI_LABELS[bisect.bisect_right(_BMI_THRESH, float(bmi))]
         except ValueError:
             return ""
 
@@ -117,14 +362,9 @@ class MedicalCampDataEntry:
         """Convert feet'inches to centimeters"""
         try:
             # Handle formats like "5'6", "5.5", "5 6", "5'6\"", "5 feet 6 inches"
-            feet_input = feet_input.strip().lower()
-
-            # Remove common words
-            feet_input = re.sub(r"\b(feet|foot|ft|inches|inch|in)\b", "", feet_input)
-            feet_input = re.sub(r'["\']', " ", feet_input)  # Replace quotes with spaces
-
-            # Extract numbers
-            numbers = re.findall(r"\d+\.?\d*", feet_input)
+            # Unit words and quotes never contain digits, so a single pass
+            # pulling out the numbers is enough
+            numbers = _NUMS.findall(feet_input)
 
             if len(numbers) == 1:
                 # Single number - could be decimal feet or just feet
@@ -141,7 +381,7 @@ class MedicalCampDataEntry:
                 return total_inches * 2.54
             else:
                 return None
-        except:
+        except (TypeError, ValueError):
             return None
 
     def cm_to_feet(self, cm):
@@ -152,7 +392,7 @@ class MedicalCampDataEntry:
             feet = int(total_inches // 12)
             inches = round(total_inches % 12)
             return f"{feet}'{inches}\""
-        except:
+        except (TypeError, ValueError):
             return ""
 
     def analyze_blood_pressure(self, bp_str):
@@ -165,9 +405,9 @@ class MedicalCampDataEntry:
             sys_val = int(systolic.strip())
             dia_val = int(diastolic.strip())
 
-            if sys_val >= 180 or dia_val >= 120:
-                return "🚨 HYPERTENSIVE CRISIS - Emergency medical care needed"
-            elif (140 <= sys_val <= 179) or (90 <= dia_val <= 119):
+            if sys_val >= _BP_CRISIS[0] or dia_val >= _BP_CRISIS[1]:
+                return _BP_CRISIS_LABEL
+            elif sys_val >= _BP_HIGH[0] or dia_val >= _BP_HIGH[1]:
                 return "🚨 HIGH BP - Immediate medical attention"
             elif (130 <= sys_val <= 139) or (80 <= dia_val <= 89):
                 return "⚠️ BP Slightly higher than normal. Consider consulting doctor."
@@ -188,23 +428,9 @@ class MedicalCampDataEntry:
         if not sugar_str:
             return ""
 
+        # Blood sugar interpretation in mmol/L
         try:
-            sugar_val = float(sugar_str)
-
-            # Blood sugar interpretation in mmol/L
-            if sugar_val < 3.9:
-                return "⚠️ LOW SUGAR - Hypoglycemia risk"
-            elif 3.9 <= sugar_val < 5.6:
-                return "✅ NORMAL SUGAR - Good glucose level"
-            elif 5.6 <= sugar_val < 7.8:
-                return "⚡ BORDERLINE - Monitor glucose levels"
-            elif 7.8 <= sugar_val < 11.1:
-                return "⚠️ HIGH SUGAR - Pre-diabetic range"
-            elif sugar_val >= 11.1:
-                return "🚨 VERY HIGH SUGAR - Diabetic range, see doctor"
-            else:
-                return "📋 Sugar level recorded"
-
+            return _SUGAR_LABELS[bisect.bisect_right(_SUGAR_THRESH, float(sugar_str))]
         except ValueError:
             return ""
 
@@ -214,23 +440,7 @@ class MedicalCampDataEntry:
             return ""
 
         try:
-            bmi_val = float(bmi_str)
-
-            if bmi_val < 16:
-                return "🚨 SEVERELY UNDERWEIGHT - Nutritional support needed"
-            elif 16 <= bmi_val < 18.5:
-                return "⚠️ UNDERWEIGHT - Increase caloric intake"
-            elif 18.5 <= bmi_val < 25:
-                return "✅ HEALTHY WEIGHT - Maintain current lifestyle"
-            elif 25 <= bmi_val < 30:
-                return "⚡ OVERWEIGHT - Diet and exercise recommended"
-            elif 30 <= bmi_val < 35:
-                return "⚠️ OBESE - Medical consultation advised"
-            elif 35 <= bmi_val < 40:
-                return "🚨 SEVERELY OBESE - Immediate medical attention"
-            else:
-                return "🚨 MORBIDLY OBESE - Urgent medical intervention"
-
+            return _BMI_HEALTH_LABELS[bisect.bisect_right(_BMI_THRESH, float(bmi_str))]
         except ValueError:
             return ""
 
@@ -240,7 +450,7 @@ class MedicalCampDataEntry:
             return ""
 
         # Remove all non-digits
-        digits = re.sub(r"\D", "", phone)
+        digits = _NONDIGIT.sub("", phone)
 
         # Check for valid BD mobile number patterns
         if len(digits) == 11 and digits.startswith("01"):
@@ -252,6 +462,23 @@ class MedicalCampDataEntry:
         else:
             return phone  # Return as-is if doesn't match patterns
 
+    def _prompt_number(
+        self, prompt, parse, low, high, range_error, type_error, allow_blank=False
+    ):
+        """Prompt until a number within [low, high] is entered (None if skipped)"""
+        while True:
+            text = input(prompt).strip()
+            if allow_blank and not text:
+                return None
+            try:
+                value = parse(text)
+            except ValueError:
+                print(type_error)
+                continue
+            if low <= value <= high:
+                return value
+            print(range_error)
+
     def add_patient(self):
         """Add a new patient record with enhanced validation"""
         print("\n" + "=" * 50)
@@ -266,17 +493,15 @@ class MedicalCampDataEntry:
             return
 
         # Age validation
-        while True:
-            try:
-                age_input = input("🎂 Age: ").strip()
-                age_val = int(age_input)
-                if 0 <= age_val <= 120:
-                    patient["Age"] = str(age_val)
-                    break
-                else:
-                    print("❌ Please enter a valid age (0-120)")
-            except ValueError:
-                print("❌ Please enter a valid number for age")
+        age_val = self._prompt_number(
+            "🎂 Age: ",
+            int,
+            0,
+            120,
+            "❌ Please enter a valid age (0-120)",
+            "❌ Please enter a valid number for age",
+        )
+        patient["Age"] = str(age_val)
 
         # Gender
         while True:
@@ -335,46 +560,30 @@ class MedicalCampDataEntry:
             else:
                 print("❌ Please enter a valid blood group or press Enter to skip")
 
-        while True:
-            sugar_input = input("🍯 Blood Sugar (mmol/L) [Enter to skip]: ").strip()
-            if sugar_input == "":
-                patient["Blood Sugar"] = ""
-                break
-            try:
-                sugar_val = float(sugar_input)
-                if 1.0 <= sugar_val <= 44.4:  # Reasonable range for mmol/L
-                    patient["Blood Sugar"] = (
-                        f"{sugar_val:.1f}"
-                        if sugar_val != int(sugar_val)
-                        else str(int(sugar_val))
-                    )
-                    break
-                else:
-                    print("❌ Please enter blood sugar between 1.0-44.4 mmol/L")
-            except ValueError:
-                print("❌ Please enter a valid number for blood sugar")
+        sugar_val = self._prompt_number(
+            "🍯 Blood Sugar (mmol/L) [Enter to skip]: ",
+            float,
+            1.0,  # Reasonable range for mmol/L
+            44.4,
+            "❌ Please enter blood sugar between 1.0-44.4 mmol/L",
+            "❌ Please enter a valid number for blood sugar",
+            allow_blank=True,
+        )
+        patient["Blood Sugar"] = "" if sugar_val is None else _fmt_num(sugar_val)
 
         # Weight
         print("\n📏 PHYSICAL MEASUREMENTS")
         print("-" * 30)
-        while True:
-            weight_input = input("⚖️  Weight (kg) [Enter to skip]: ").strip()
-            if weight_input == "":
-                patient["Weight"] = ""
-                break
-            try:
-                weight_val = float(weight_input)
-                if 1 <= weight_val <= 500:  # Reasonable range
-                    patient["Weight"] = (
-                        f"{weight_val:.1f}"
-                        if weight_val != int(weight_val)
-                        else str(int(weight_val))
-                    )
-                    break
-                else:
-                    print("❌ Please enter weight between 1-500 kg")
-            except ValueError:
-                print("❌ Please enter a valid number for weight")
+        weight_val = self._prompt_number(
+            "⚖️  Weight (kg) [Enter to skip]: ",
+            float,
+            1,  # Reasonable range
+            500,
+            "❌ Please enter weight between 1-500 kg",
+            "❌ Please enter a valid number for weight",
+            allow_blank=True,
+        )
+        patient["Weight"] = "" if weight_val is None else _fmt_num(weight_val)
 
         # Height with feet/cm options
         print("📐 Height can be entered in:")
@@ -391,11 +600,7 @@ class MedicalCampDataEntry:
             # Try to parse as feet first
             height_cm = self.feet_to_cm(height_input)
             if height_cm and 30 <= height_cm <= 300:
-                patient["Height (cm)"] = (
-                    f"{height_cm:.1f}"
-                    if height_cm != int(height_cm)
-                    else str(int(height_cm))
-                )
+                patient["Height (cm)"] = _fmt_num(height_cm)
                 patient["Height (ft)"] = self.cm_to_feet(height_cm)
                 break
 
@@ -403,11 +608,7 @@ class MedicalCampDataEntry:
             try:
                 height_val = float(height_input)
                 if 30 <= height_val <= 300:
-                    patient["Height (cm)"] = (
-                        f"{height_val:.1f}"
-                        if height_val != int(height_val)
-                        else str(int(height_val))
-                    )
+                    patient["Height (cm)"] = _fmt_num(height_val)
                     patient["Height (ft)"] = self.cm_to_feet(height_val)
                     break
                 else:
@@ -422,41 +623,33 @@ class MedicalCampDataEntry:
         else:
             patient["BMI"] = ""
 
-        # Generate health comments
-        health_comments = []
-
-        # Analyze blood pressure
+        # Generate health comments, analysing each vital sign once
         bp_comment = self.analyze_blood_pressure(patient["Blood Pressure"])
-        if bp_comment:
-            health_comments.append(bp_comment)
-
-        # Analyze blood sugar
         sugar_comment = self.analyze_blood_sugar(patient["Blood Sugar"])
-        if sugar_comment:
-            health_comments.append(sugar_comment)
-
-        # Analyze BMI
         bmi_comment = self.analyze_bmi_health(patient["BMI"])
-        if bmi_comment:
-            health_comments.append(bmi_comment)
 
         # Additional health observations based on age
         age_val = int(patient["Age"])
         if age_val >= 60:
-            health_comments.append("👴 SENIOR - Regular health checkups recommended")
+            age_comment = "👴 SENIOR - Regular health checkups recommended"
         elif age_val <= 2:
-            health_comments.append("👶 INFANT - Pediatric care recommended")
+            age_comment = "👶 INFANT - Pediatric care recommended"
         elif age_val <= 12:
-            health_comments.append("🧒 CHILD - Growth monitoring important")
+            age_comment = "🧒 CHILD - Growth monitoring important"
         elif age_val <= 19:
-            health_comments.append("👦 ADOLESCENT - Developmental checkups advised")
+            age_comment = "👦 ADOLESCENT - Developmental checkups advised"
+        else:
+            age_comment = ""
 
+        health_comments = list(
+            filter(None, (bp_comment, sugar_comment, bmi_comment, age_comment))
+        )
         patient["Health Comments"] = " | ".join(health_comments)
 
         # Add timestamp
         patient["Date Added"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        self.data.append(patient)
+        self._append_record(patient)
 
         # Display comprehensive patient summary
         print("\n" + "=" * 60)
@@ -469,19 +662,17 @@ class MedicalCampDataEntry:
 
         print(f"\n🩺 VITAL SIGNS:")
         if patient["Blood Pressure"]:
-            bp_analysis = self.analyze_blood_pressure(patient["Blood Pressure"])
             print(f"   ❤️  Blood Pressure: {patient['Blood Pressure']} mmHg")
-            if bp_analysis:
-                print(f"      → {bp_analysis}")
+            if bp_comment:
+                print(f"      → {bp_comment}")
 
         if patient["Blood Group"]:
             print(f"   🩸 Blood Group: {patient['Blood Group']}")
 
         if patient["Blood Sugar"]:
-            sugar_analysis = self.analyze_blood_sugar(patient["Blood Sugar"])
             print(f"   🍯 Blood Sugar: {patient['Blood Sugar']} mmol/L")
-            if sugar_analysis:
-                print(f"      → {sugar_analysis}")
+            if sugar_comment:
+                print(f"      → {sugar_comment}")
 
         print(f"\n📏 PHYSICAL MEASUREMENTS:")
         if patient["Weight"]:
@@ -492,22 +683,28 @@ class MedicalCampDataEntry:
             )
         if patient["BMI"]:
             bmi_category = self.categorize_bmi(patient["BMI"])
-            bmi_analysis = self.analyze_bmi_health(patient["BMI"])
             print(f"   📊 BMI: {patient['BMI']} ({bmi_category})")
-            if bmi_analysis:
-                print(f"      → {bmi_analysis}")
+            if bmi_comment:
+                print(f"      → {bmi_comment}")
 
-        if patient["Health Comments"]:
+        if health_comments:
             print(f"\n💡 HEALTH INSIGHTS:")
-            for comment in patient["Health Comments"].split(" | "):
+            for comment in health_comments:
                 print(f"   • {comment}")
 
         print(f"\n📅 Recorded: {patient['Date Added']}")
         print("=" * 60)
-        print("✅ Patient record added successfully!")
 
-        # Auto-save to Excel after adding
-        self.save_to_excel()
+        # Log the record; the workbook is rebuilt on save and at exit
+        try:
+            self._log_record(patient)
+        except OSError as e:
+            print(f"❌ Error writing record log: {e}")
+            # Without a log the exit-time export would miss this record
+            self.save_to_excel()
+        else:
+            print(f"📝 Record logged to {self._log_path}")
+        print("✅ Patient record added successfully!")
 
     def view_patients(self):
         """View all patients with enhanced display"""
@@ -582,25 +779,26 @@ class MedicalCampDataEntry:
         else:
             print("❌ Invalid choice")
 
+    def _filter(self, values, pred):
+        """Return (index, patient) pairs whose column value matches pred"""
+        data = self.data
+        return [(i, data[i]) for i, value in enumerate(values) if pred(value)]
+
     def _search_by_name(self):
         """Search patients by name"""
         search_name = input("\n👤 Enter patient name to search: ").strip().lower()
-        found_patients = []
-
-        for i, patient in enumerate(self.data):
-            if search_name in patient["Name"].lower():
-                found_patients.append((i, patient))
+        found_patients = self._filter(
+            self._name_lower, lambda name: search_name in name
+        )
 
         self._display_search_results(found_patients, f"name containing '{search_name}'")
 
     def _search_by_blood_group(self):
         """Search patients by blood group"""
         blood_group = input("\n🩸 Enter blood group (e.g., A+, O-): ").strip().upper()
-        found_patients = []
-
-        for i, patient in enumerate(self.data):
-            if patient.get("Blood Group", "").upper() == blood_group:
-                found_patients.append((i, patient))
+        found_patients = self._filter(
+            self.columns_data["Blood Group"], lambda group: group.upper() == blood_group
+        )
 
         self._display_search_results(found_patients, f"blood group {blood_group}")
 
@@ -610,11 +808,10 @@ class MedicalCampDataEntry:
             min_age = int(input("\n🎂 Minimum age: ").strip())
             max_age = int(input("🎂 Maximum age: ").strip())
 
-            found_patients = []
-            for i, patient in enumerate(self.data):
-                age = int(patient.get("Age", 0))
-                if min_age <= age <= max_age:
-                    found_patients.append((i, patient))
+            found_patients = self._filter(
+                self.columns_data["Age"],
+                lambda age: bool(age) and min_age <= int(age) <= max_age,
+            )
 
             self._display_search_results(
                 found_patients, f"age between {min_age}-{max_age}"
@@ -630,12 +827,9 @@ class MedicalCampDataEntry:
         print("- underweight, overweight, obese")
 
         condition = input("\n🔍 Enter condition to search: ").strip().lower()
-        found_patients = []
-
-        for i, patient in enumerate(self.data):
-            health_comments = patient.get("Health Comments", "").lower()
-            if condition in health_comments:
-                found_patients.append((i, patient))
+        found_patients = self._filter(
+            self._health_lower, lambda comment: condition in comment
+        )
 
         self._display_search_results(found_patients, f"condition '{condition}'")
 
@@ -685,63 +879,36 @@ class MedicalCampDataEntry:
             return
 
         try:
-            # Create workbook and worksheet
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Medical Camp Data"
+            # Create a streaming workbook; rows are written as they are appended
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("Medical Camp Data")
+            self._add_named_styles(wb)
 
-            # Write headers with formatting
             headers = self.columns
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(
-                    start_color="366092", end_color="366092", fill_type="solid"
-                )
-                cell.alignment = Alignment(horizontal="center")
-
-            # Write data
-            for row, patient in enumerate(self.data, 2):
-                for col, header in enumerate(headers, 1):
-                    value = patient.get(header, "")
-                    ws.cell(row=row, column=col, value=value)
 
-            # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column_letter = get_column_letter(column[0].column)
+            # Column widths must be set before the first row is streamed
+            widths = [len(header) for header in headers]
+            for patient in self.data:
+                for col, header in enumerate(headers):
+                    length = len(str(patient.get(header, "")))
+                    if length > widths[col]:
+                        widths[col] = length
 
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-
-                adjusted_width = min(max_length + 3, 40)
-                ws.column_dimensions[column_letter].width = adjusted_width
-
-            # Add borders and alternating row colors
-            thin_border = Border(
-                left=Side(style="thin"),
-                right=Side(style="thin"),
-                top=Side(style="thin"),
-                bottom=Side(style="thin"),
-            )
+            for col, width in enumerate(widths, 1):
+                ws.column_dimensions[get_column_letter(col)].width = min(width + 3, 40)
 
-            # Apply formatting to all cells
-            for row in ws.iter_rows():
-                for cell in row:
-                    cell.border = thin_border
-                    cell.alignment = Alignment(horizontal="center", vertical="center")
+            # Write headers with formatting
+            ws.append([self._styled_cell(ws, h, style=_HEADER_STYLE) for h in headers])
 
-            # Alternate row colors (light blue for even rows)
-            light_fill = PatternFill(
-                start_color="F0F8FF", end_color="F0F8FF", fill_type="solid"
-            )
-            for row in range(3, len(self.data) + 2, 2):
-                for col in range(1, len(headers) + 1):
-                    ws.cell(row=row, column=col).fill = light_fill
+            # Write data with borders and alternating row colors
+            for row, patient in enumerate(self.data, 2):
+                style = _DATA_ALT_STYLE if row % 2 else _DATA_STYLE
+                ws.append(
+                    [
+                        self._styled_cell(ws, patient.get(header, ""), style=style)
+                        for header in headers
+                    ]
+                )
 
             # Create summary sheet
             summary_ws = wb.create_sheet("Summary Report")
@@ -754,6 +921,10 @@ class MedicalCampDataEntry:
             # Save the workbook
             wb.save(self.filename)
 
+            # The workbook now holds every logged record
+            if os.path.isfile(self._log_path):
+                os.remove(self._log_path)
+
             print(f"💾 Data saved to Excel: {self.filename}")
             print(f"📊 Total records: {len(self.data)}")
             print(f"📄 Sheets created: Patient Data, Summary Report, Health Alerts")
@@ -761,80 +932,117 @@ class MedicalCampDataEntry:
         except Exception as e:
             print(f"❌ Error saving Excel file: {e}")
 
+    def _add_named_styles(self, wb):
+        """Register the named cell styles used by the sheets on wb"""
+        for style in (
+            NamedStyle(
+                name=_HEADER_STYLE,
+                font=_HEADER_FONT,
+                fill=_HEADER_FILL,
+                border=_BORDER,
+                alignment=_CENTER,
+            ),
+            NamedStyle(
+                name=_DATA_STYLE, font=DEFAULT_FONT, border=_BORDER, alignment=_CENTER
+            ),
+            NamedStyle(
+                name=_DATA_ALT_STYLE,
+                font=DEFAULT_FONT,
+                fill=_ALT_FILL,
+                border=_BORDER,
+                alignment=_CENTER,
+            ),
+            NamedStyle(
+                name=_HIGH_ROW_STYLE,
+                font=DEFAULT_FONT,
+                fill=_HIGH_ROW_FILL,
+                border=DEFAULT_BORDER,
+            ),
+            NamedStyle(
+                name=_MEDIUM_ROW_STYLE,
+                font=DEFAULT_FONT,
+                fill=_MEDIUM_ROW_FILL,
+                border=DEFAULT_BORDER,
+            ),
+        ):
+            wb.add_named_style(style)
+
+    def _styled_cell(self, ws, value, font=None, fill=None, style=None):
+        """Create a write-only cell carrying the given named style or font/fill"""
+        cell = WriteOnlyCell(ws, value=value)
+        if style is not None:
+            cell.style = style
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        return cell
+
+    def _add_row(self, rows, widths, values=(), font=None, fill=None, style=None):
+        """Queue a row of values, with an optional style or font/fill for its cells"""
+        rows.append((values, font, fill, style))
+
+        # Track the longest value per column as rows are queued
+        for col, value in enumerate(values, 1):
+            if value is not None:
+                length = len(str(value))
+                if length > widths.get(col, 0):
+                    widths[col] = length
+
+    def _write_rows(self, ws, rows, widths, max_width):
+        """Apply the tracked column widths, then stream rows into ws"""
+        for col, width in widths.items():
+            ws.column_dimensions[get_column_letter(col)].width = min(
+                width + 3, max_width
+            )
+
+        # Cells are only created for styled rows, right before they're written
+        for values, font, fill, style in rows:
+            if font is None and fill is None and style is None:
+                ws.append(list(values))
+            else:
+                ws.append([self._styled_cell(ws, v, font, fill, style) for v in values])
+
     def _create_health_alerts_sheet(self, ws):
         """Create health alerts sheet for patients needing attention"""
+        rows = []
+        widths = {}
+
         # Title
-        ws["A1"] = "HEALTH ALERTS & PRIORITY PATIENTS"
-        ws["A1"].font = Font(bold=True, size=16, color="FFFFFF")
-        ws["A1"].fill = PatternFill(
-            start_color="DC143C", end_color="DC143C", fill_type="solid"
+        self._add_row(
+            rows,
+            widths,
+            ["HEALTH ALERTS & PRIORITY PATIENTS"],
+            _TITLE_FONT,
+            _HIGH_FILL,
         )
-        ws.merge_cells("A1:F1")
-
-        row = 3
-
-        # High priority alerts
-        high_priority = []
-        medium_priority = []
-
-        for patient in self.data:
-            alerts = []
-            priority = "LOW"
-
-            # Check blood pressure
-            bp_comment = self.analyze_blood_pressure(patient.get("Blood Pressure", ""))
-            if "CRISIS" in bp_comment or "STAGE 2" in bp_comment:
-                alerts.append(bp_comment)
-                priority = "HIGH"
-            elif "STAGE 1" in bp_comment or "LOW BP" in bp_comment:
-                alerts.append(bp_comment)
-                if priority != "HIGH":
-                    priority = "MEDIUM"
-
-            # Check blood sugar
-            sugar_comment = self.analyze_blood_sugar(patient.get("Blood Sugar", ""))
-            if "VERY HIGH" in sugar_comment or "LOW SUGAR" in sugar_comment:
-                alerts.append(sugar_comment)
-                priority = "HIGH"
-            elif "HIGH SUGAR" in sugar_comment:
-                alerts.append(sugar_comment)
-                if priority != "HIGH":
-                    priority = "MEDIUM"
-
-            # Check BMI
-            bmi_comment = self.analyze_bmi_health(patient.get("BMI", ""))
-            if "SEVERELY" in bmi_comment or "MORBIDLY" in bmi_comment:
-                alerts.append(bmi_comment)
-                priority = "HIGH"
-            elif "OBESE" in bmi_comment:
-                alerts.append(bmi_comment)
-                if priority != "HIGH":
-                    priority = "MEDIUM"
-
-            if alerts:
-                patient_alert = {
-                    "name": patient["Name"],
-                    "age": patient["Age"],
-                    "gender": patient["Gender"],
-                    "phone": patient.get("Phone", ""),
-                    "alerts": alerts,
-                    "priority": priority,
-                }
-
-                if priority == "HIGH":
-                    high_priority.append(patient_alert)
-                else:
-                    medium_priority.append(patient_alert)
+        ws.merged_cells.add("A1:F1")
+        self._add_row(rows, widths)
+
+        # (severity, alert) for every patient with something to follow up
+        flagged = [
+            result
+            for result in map(
+                _analyze_patient, self.data, self._bp, self._sugar, self._bmi
+            )
+            if result is not None
+        ]
+
+        high_priority = [alert for severity, alert in flagged if severity == 2]
+        medium_priority = [alert for severity, alert in flagged if severity == 1]
 
         # High Priority Section
         if high_priority:
-            ws[f"A{row}"] = "🚨 HIGH PRIORITY ALERTS"
-            ws[f"A{row}"].font = Font(bold=True, size=14, color="FFFFFF")
-            ws[f"A{row}"].fill = PatternFill(
-                start_color="DC143C", end_color="DC143C", fill_type="solid"
+            row = len(rows) + 1
+            self._add_row(
+                rows,
+                widths,
+                ["🚨 HIGH PRIORITY ALERTS"],
+                _SECTION_FONT,
+                _HIGH_FILL,
             )
-            ws.merge_cells(f"A{row}:F{row}")
-            row += 2
+            ws.merged_cells.add(f"A{row}:F{row}")
+            self._add_row(rows, widths)
 
             # Headers
             headers = [
@@ -845,40 +1053,43 @@ class MedicalCampDataEntry:
                 "Health Alerts",
                 "Action Required",
             ]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(
-                    start_color="8B0000", end_color="8B0000", fill_type="solid"
-                )
-            row += 1
+            self._add_row(
+                rows,
+                widths,
+                headers,
+                _HEADER_FONT,
+                _HIGH_HEADER_FILL,
+            )
 
             for alert in high_priority:
-                ws.cell(row=row, column=1, value=alert["name"])
-                ws.cell(row=row, column=2, value=alert["age"])
-                ws.cell(row=row, column=3, value=alert["gender"])
-                ws.cell(row=row, column=4, value=alert["phone"])
-                ws.cell(row=row, column=5, value=" | ".join(alert["alerts"]))
-                ws.cell(row=row, column=6, value="Immediate medical attention required")
-
                 # Color code the row
-                for col in range(1, 7):
-                    ws.cell(row=row, column=col).fill = PatternFill(
-                        start_color="FFE4E1", end_color="FFE4E1", fill_type="solid"
-                    )
-
-                row += 1
-            row += 1
+                self._add_row(
+                    rows,
+                    widths,
+                    [
+                        alert["name"],
+                        alert["age"],
+                        alert["gender"],
+                        alert["phone"],
+                        alert["alerts"],
+                        "Immediate medical attention required",
+                    ],
+                    style=_HIGH_ROW_STYLE,
+                )
+            self._add_row(rows, widths)
 
         # Medium Priority Section
         if medium_priority:
-            ws[f"A{row}"] = "⚠️ MEDIUM PRIORITY ALERTS"
-            ws[f"A{row}"].font = Font(bold=True, size=14, color="FFFFFF")
-            ws[f"A{row}"].fill = PatternFill(
-                start_color="FF8C00", end_color="FF8C00", fill_type="solid"
+            row = len(rows) + 1
+            self._add_row(
+                rows,
+                widths,
+                ["⚠️ MEDIUM PRIORITY ALERTS"],
+                _SECTION_FONT,
+                _MEDIUM_FILL,
             )
-            ws.merge_cells(f"A{row}:F{row}")
-            row += 2
+            ws.merged_cells.add(f"A{row}:F{row}")
+            self._add_row(rows, widths)
 
             # Headers
             headers = [
@@ -889,291 +1100,295 @@ class MedicalCampDataEntry:
                 "Health Alerts",
                 "Recommendation",
             ]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(
-                    start_color="FF6347", end_color="FF6347", fill_type="solid"
-                )
-            row += 1
+            self._add_row(
+                rows,
+                widths,
+                headers,
+                _HEADER_FONT,
+                _MEDIUM_HEADER_FILL,
+            )
 
             for alert in medium_priority:
-                ws.cell(row=row, column=1, value=alert["name"])
-                ws.cell(row=row, column=2, value=alert["age"])
-                ws.cell(row=row, column=3, value=alert["gender"])
-                ws.cell(row=row, column=4, value=alert["phone"])
-                ws.cell(row=row, column=5, value=" | ".join(alert["alerts"]))
-                ws.cell(row=row, column=6, value="Follow-up recommended")
-
                 # Color code the row
-                for col in range(1, 7):
-                    ws.cell(row=row, column=col).fill = PatternFill(
-                        start_color="FFF8DC", end_color="FFF8DC", fill_type="solid"
-                    )
-
-                row += 1
+                self._add_row(
+                    rows,
+                    widths,
+                    [
+                        alert["name"],
+                        alert["age"],
+                        alert["gender"],
+                        alert["phone"],
+                        alert["alerts"],
+                        "Follow-up recommended",
+                    ],
+                    style=_MEDIUM_ROW_STYLE,
+                )
 
         # Summary statistics
-        row += 2
-        ws[f"A{row}"] = "ALERT SUMMARY"
-        ws[f"A{row}"].font = Font(bold=True, size=12)
-        row += 1
-
-        ws[f"A{row}"] = f"High Priority Patients: {len(high_priority)}"
-        ws[f"A{row}"].font = Font(color="DC143C")
-        row += 1
-        ws[f"A{row}"] = f"Medium Priority Patients: {len(medium_priority)}"
-        ws[f"A{row}"].font = Font(color="FF8C00")
-        row += 1
-        ws[f"A{row}"] = (
-            f"Total Patients Needing Follow-up: {len(high_priority) + len(medium_priority)}"
+        self._add_row(rows, widths)
+        self._add_row(rows, widths)
+        self._add_row(rows, widths, ["ALERT SUMMARY"], _HEADING_FONT)
+        self._add_row(
+            rows,
+            widths,
+            [f"High Priority Patients: {len(high_priority)}"],
+            _HIGH_FONT,
+        )
+        self._add_row(
+            rows,
+            widths,
+            [f"Medium Priority Patients: {len(medium_priority)}"],
+            _MEDIUM_FONT,
+        )
+        self._add_row(
+            rows,
+            widths,
+            [
+                f"Total Patients Needing Follow-up: {len(high_priority) + len(medium_priority)}"
+            ],
+            _BOLD_FONT,
         )
-        ws[f"A{row}"].font = Font(bold=True)
 
         # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
+        self._write_rows(ws, rows, widths, 35)
 
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
+    def _compute_summary(self):
+        """Return the summary figures, recomputed only after the records change"""
+        if self._summary_cache is not None:
+            return self._summary_cache
+
+        n = len(self.data)
 
-            adjusted_width = min(max_length + 3, 35)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        # Counters taken column by column from the per-record lists
+        columns = self.columns_data
+        male_count = sum(self._is_male)
+        sugar_tested = sum(map(bool, columns["Blood Sugar"]))
+        bp_tested = sum(map(bool, columns["Blood Pressure"]))
+        phone_provided = sum(map(bool, columns["Phone"]))
+        high_sugar = sum(
+            1 for sugar in self._sugar if sugar is not None and sugar >= _HIGH_SUGAR
+        )
+        obese = sum(1 for bmi in self._bmi if bmi is not None and bmi >= _OBESE_BMI)
+        high_bp = crisis_bp = 0
+        for bp in self._bp:
+            if bp is not None:
+                systolic, diastolic = bp
+                if systolic >= _BP_CRISIS[0] or diastolic >= _BP_CRISIS[1]:
+                    crisis_bp += 1
+                elif systolic >= _BP_HIGH[0] or diastolic >= _BP_HIGH[1]:
+                    high_bp += 1
+        female_count = n - male_count
+
+        blood_groups = Counter(filter(None, map(str.strip, columns["Blood Group"])))
+        tested_for_blood_group = sum(blood_groups.values())
+
+        # Count categories by threshold index, in _BMI_LABELS order
+        bmi_counts = [0] * len(_BMI_LABELS)
+        bmi_values = []
+
+        for bmi_val in self._bmi:
+            if bmi_val is not None:
+                bmi_values.append(bmi_val)
+                bmi_counts[bisect.bisect_right(_BMI_THRESH, bmi_val)] += 1
+        measured_count = len(bmi_values)
+
+        self._summary_cache = SummaryStats(
+            n=n,
+            male_count=male_count,
+            female_count=female_count,
+            ages=self._ages,
+            blood_groups=blood_groups,
+            tested_for_blood_group=tested_for_blood_group,
+            bmi_counts=bmi_counts,
+            bmi_values=bmi_values,
+            measured_count=measured_count,
+            sugar_tested=sugar_tested,
+            bp_tested=bp_tested,
+            phone_provided=phone_provided,
+            high_bp=high_bp,
+            high_sugar=high_sugar,
+            obese=obese,
+            crisis_bp=crisis_bp,
+        )
+        return self._summary_cache
 
     def _create_summary_sheet(self, ws):
         """Create a comprehensive summary sheet in the Excel workbook"""
+        rows = []
+        widths = {}
+        stats = self._compute_summary()
+        n = stats.n
+
         # Title
-        ws["A1"] = "HASHIMUKH MEDICAL CAMP COMPREHENSIVE REPORT"
-        ws["A1"].font = Font(bold=True, size=16, color="FFFFFF")
-        ws["A1"].fill = PatternFill(
-            start_color="366092", end_color="366092", fill_type="solid"
+        self._add_row(
+            rows,
+            widths,
+            ["HASHIMUKH MEDICAL CAMP COMPREHENSIVE REPORT"],
+            _TITLE_FONT,
+            _HEADER_FILL,
         )
-        ws.merge_cells("A1:D1")
-
-        row = 3
+        ws.merged_cells.add("A1:D1")
+        self._add_row(rows, widths)
 
         # Basic statistics
-        ws[f"A{row}"] = "BASIC STATISTICS"
-        ws[f"A{row}"].font = Font(bold=True, size=12)
-        row += 1
-
-        ws[f"A{row}"] = f"Total Patients Registered:"
-        ws[f"B{row}"] = len(self.data)
-        row += 1
+        self._add_row(rows, widths, ["BASIC STATISTICS"], _HEADING_FONT)
+        self._add_row(rows, widths, [f"Total Patients Registered:", n])
 
         # Gender statistics
-        male_count = sum(1 for p in self.data if p.get("Gender", "").lower() == "male")
-        female_count = len(self.data) - male_count
-
-        ws[f"A{row}"] = f"Male Patients:"
-        ws[f"B{row}"] = f"{male_count} ({male_count/len(self.data)*100:.1f}%)"
-        row += 1
-        ws[f"A{row}"] = f"Female Patients:"
-        ws[f"B{row}"] = f"{female_count} ({female_count/len(self.data)*100:.1f}%)"
-        row += 1
+        self._add_row(
+            rows,
+            widths,
+            [
+                f"Male Patients:",
+                f"{stats.male_count} ({stats.male_count/n*100:.1f}%)",
+            ],
+        )
+        self._add_row(
+            rows,
+            widths,
+            [
+                f"Female Patients:",
+                f"{stats.female_count} ({stats.female_count/n*100:.1f}%)",
+            ],
+        )
 
         # Age statistics
-        ages = [int(p["Age"]) for p in self.data if str(p["Age"]).isdigit()]
+        ages = stats.ages
         if ages:
-            ws[f"A{row}"] = f"Age Range:"
-            ws[f"B{row}"] = f"{min(ages)} - {max(ages)} years"
-            row += 1
-            ws[f"A{row}"] = f"Average Age:"
-            ws[f"B{row}"] = f"{sum(ages)/len(ages):.1f} years"
-            row += 1
-            ws[f"A{row}"] = f"Median Age:"
-            ws[f"B{row}"] = f"{sorted(ages)[len(ages)//2]:.1f} years"
-            row += 2
+            self._add_row(
+                rows, widths, [f"Age Range:", f"{min(ages)} - {max(ages)} years"]
+            )
+            self._add_row(
+                rows, widths, [f"Average Age:", f"{sum(ages)/len(ages):.1f} years"]
+            )
+            self._add_row(
+                rows,
+                widths,
+                [f"Median Age:", f"{statistics.median_high(ages):.1f} years"],
+            )
+            self._add_row(rows, widths)
 
         # Blood Group Distribution
-        ws[f"A{row}"] = "BLOOD GROUP DISTRIBUTION"
-        ws[f"A{row}"].font = Font(bold=True, size=12)
-        row += 1
-
-        blood_groups = {}
-        tested_for_blood_group = 0
-        for p in self.data:
-            bg = p.get("Blood Group", "").strip()
-            if bg:
-                blood_groups[bg] = blood_groups.get(bg, 0) + 1
-                tested_for_blood_group += 1
-
-        if blood_groups:
-            ws[f"A{row}"] = "Blood Group"
-            ws[f"B{row}"] = "Count"
-            ws[f"C{row}"] = "Percentage"
+        self._add_row(rows, widths, ["BLOOD GROUP DISTRIBUTION"], _HEADING_FONT)
 
+        if stats.blood_groups:
             # Header formatting
-            for col in ["A", "B", "C"]:
-                ws[f"{col}{row}"].font = Font(bold=True)
-                ws[f"{col}{row}"].fill = PatternFill(
-                    start_color="D3D3D3", end_color="D3D3D3", fill_type="solid"
-                )
-
-            row += 1
+            self._add_row(
+                rows,
+                widths,
+                ["Blood Group", "Count", "Percentage"],
+                _BOLD_FONT,
+                _TABLE_HEADER_FILL,
+            )
 
-            for bg in sorted(blood_groups.keys()):
-                count = blood_groups[bg]
-                percentage = (count / tested_for_blood_group) * 100
-                ws[f"A{row}"] = bg
-                ws[f"B{row}"] = count
-                ws[f"C{row}"] = f"{percentage:.1f}%"
-                row += 1
+            for bg in sorted(stats.blood_groups):
+                count = stats.blood_groups[bg]
+                percentage = (count / stats.tested_for_blood_group) * 100
+                self._add_row(rows, widths, [bg, count, f"{percentage:.1f}%"])
 
-        ws[f"A{row}"] = f"Not Tested for Blood Group:"
-        ws[f"B{row}"] = len(self.data) - tested_for_blood_group
-        row += 2
+        self._add_row(
+            rows,
+            widths,
+            [f"Not Tested for Blood Group:", n - stats.tested_for_blood_group],
+        )
+        self._add_row(rows, widths)
 
         # BMI Statistics
-        ws[f"A{row}"] = "BMI STATISTICS"
-        ws[f"A{row}"].font = Font(bold=True, size=12)
-        row += 1
-
-        bmi_categories = {
-            "Severely Underweight": 0,
-            "Underweight": 0,
-            "Normal": 0,
-            "Overweight": 0,
-            "Obese Class I": 0,
-            "Obese Class II": 0,
-            "Obese Class III": 0,
-        }
-        measured_count = 0
-        bmi_values = []
-
-        for p in self.data:
-            if p.get("BMI", ""):
-                measured_count += 1
-                bmi_val = float(p["BMI"])
-                bmi_values.append(bmi_val)
-                bmi_cat = self.categorize_bmi(p["BMI"])
-                if bmi_cat in bmi_categories:
-                    bmi_categories[bmi_cat] += 1
-
-        if measured_count > 0:
-            ws[f"A{row}"] = "BMI Category"
-            ws[f"B{row}"] = "Count"
-            ws[f"C{row}"] = "Percentage"
+        self._add_row(rows, widths, ["BMI STATISTICS"], _HEADING_FONT)
 
+        if stats.measured_count > 0:
             # Header formatting
-            for col in ["A", "B", "C"]:
-                ws[f"{col}{row}"].font = Font(bold=True)
-                ws[f"{col}{row}"].fill = PatternFill(
-                    start_color="D3D3D3", end_color="D3D3D3", fill_type="solid"
-                )
-
-            row += 1
+            self._add_row(
+                rows,
+                widths,
+                ["BMI Category", "Count", "Percentage"],
+                _BOLD_FONT,
+                _TABLE_HEADER_FILL,
+            )
 
-            for category, count in bmi_categories.items():
+            for category, count in zip(_BMI_LABELS, stats.bmi_counts):
                 if count > 0:
-                    percentage = (count / measured_count) * 100
-                    ws[f"A{row}"] = category
-                    ws[f"B{row}"] = count
-                    ws[f"C{row}"] = f"{percentage:.1f}%"
-                    row += 1
+                    percentage = (count / stats.measured_count) * 100
+                    self._add_row(rows, widths, [category, count, f"{percentage:.1f}%"])
 
             # BMI statistics
-            row += 1
-            ws[f"A{row}"] = f"Average BMI:"
-            ws[f"B{row}"] = f"{sum(bmi_values)/len(bmi_values):.1f}"
-            row += 1
-            ws[f"A{row}"] = f"BMI Range:"
-            ws[f"B{row}"] = f"{min(bmi_values):.1f} - {max(bmi_values):.1f}"
+            self._add_row(rows, widths)
+            self._add_row(
+                rows,
+                widths,
+                [f"Average BMI:", f"{sum(stats.bmi_values)/len(stats.bmi_values):.1f}"],
+            )
+            self._add_row(
+                rows,
+                widths,
+                [
+                    f"BMI Range:",
+                    f"{min(stats.bmi_values):.1f} - {max(stats.bmi_values):.1f}",
+                ],
+            )
 
-        ws[f"A{row+1}"] = f"Not Measured for BMI:"
-        ws[f"B{row+1}"] = len(self.data) - measured_count
-        row += 3
+        self._add_row(
+            rows, widths, [f"Not Measured for BMI:", n - stats.measured_count]
+        )
+        self._add_row(rows, widths)
 
         # Health Screening Coverage
-        ws[f"A{row}"] = "HEALTH SCREENING COVERAGE"
-        ws[f"A{row}"].font = Font(bold=True, size=12)
-        row += 1
-
-        sugar_tested = sum(1 for p in self.data if p.get("Blood Sugar", ""))
-        bp_tested = sum(1 for p in self.data if p.get("Blood Pressure", ""))
-        phone_provided = sum(1 for p in self.data if p.get("Phone", ""))
+        self._add_row(rows, widths, ["HEALTH SCREENING COVERAGE"], _HEADING_FONT)
 
         tests = [
-            ("Blood Group Testing", tested_for_blood_group),
-            ("Blood Sugar Testing", sugar_tested),
-            ("Blood Pressure Check", bp_tested),
-            ("BMI Calculation", measured_count),
-            ("Contact Information", phone_provided),
+            ("Blood Group Testing", stats.tested_for_blood_group),
+            ("Blood Sugar Testing", stats.sugar_tested),
+            ("Blood Pressure Check", stats.bp_tested),
+            ("BMI Calculation", stats.measured_count),
+            ("Contact Information", stats.phone_provided),
         ]
 
-        ws[f"A{row}"] = "Screening Type"
-        ws[f"B{row}"] = "Completed"
-        ws[f"C{row}"] = "Coverage %"
-
         # Header formatting
-        for col in ["A", "B", "C"]:
-            ws[f"{col}{row}"].font = Font(bold=True)
-            ws[f"{col}{row}"].fill = PatternFill(
-                start_color="D3D3D3", end_color="D3D3D3", fill_type="solid"
-            )
-
-        row += 1
+        self._add_row(
+            rows,
+            widths,
+            ["Screening Type", "Completed", "Coverage %"],
+            _BOLD_FONT,
+            _TABLE_HEADER_FILL,
+        )
 
         for test_name, count in tests:
-            percentage = (count / len(self.data)) * 100
-            ws[f"A{row}"] = test_name
-            ws[f"B{row}"] = f"{count}/{len(self.data)}"
-            ws[f"C{row}"] = f"{percentage:.1f}%"
-            row += 1
+            percentage = (count / n) * 100
+            self._add_row(
+                rows,
+                widths,
+                [test_name, f"{count}/{n}", f"{percentage:.1f}%"],
+            )
 
         # Health Alert Summary
-        row += 2
-        ws[f"A{row}"] = "HEALTH ALERT SUMMARY"
-        ws[f"A{row}"].font = Font(bold=True, size=12, color="DC143C")
-        row += 1
-
-        high_bp = sum(
-            1
-            for p in self.data
-            if "HIGH BP" in self.analyze_blood_pressure(p.get("Blood Pressure", ""))
+        self._add_row(rows, widths)
+        self._add_row(rows, widths)
+        self._add_row(
+            rows,
+            widths,
+            ["HEALTH ALERT SUMMARY"],
+            _ALERT_HEADING_FONT,
         )
-        high_sugar = sum(
-            1
-            for p in self.data
-            if "HIGH SUGAR" in self.analyze_blood_sugar(p.get("Blood Sugar", ""))
+
+        self._add_row(
+            rows, widths, [f"Patients with High Blood Pressure:", stats.high_bp]
         )
-        obese = sum(
-            1 for p in self.data if "OBESE" in self.analyze_bmi_health(p.get("BMI", ""))
+        self._add_row(
+            rows, widths, [f"Patients with High Blood Sugar:", stats.high_sugar]
+        )
+        self._add_row(rows, widths, [f"Patients with Obesity:", stats.obese])
+        self._add_row(
+            rows,
+            widths,
+            [
+                f"Total Patients Needing Follow-up:",
+                stats.high_bp + stats.high_sugar + stats.obese,
+            ],
+            _BOLD_FONT,
         )
-
-        ws[f"A{row}"] = f"Patients with High Blood Pressure:"
-        ws[f"B{row}"] = high_bp
-        row += 1
-        ws[f"A{row}"] = f"Patients with High Blood Sugar:"
-        ws[f"B{row}"] = high_sugar
-        row += 1
-        ws[f"A{row}"] = f"Patients with Obesity:"
-        ws[f"B{row}"] = obese
-        row += 1
-        ws[f"A{row}"] = f"Total Patients Needing Follow-up:"
-        ws[f"B{row}"] = high_bp + high_sugar + obese
-        ws[f"A{row}"].font = Font(bold=True)
-        ws[f"B{row}"].font = Font(bold=True)
 
         # Auto-adjust column widths for summary sheet
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-
-            adjusted_width = min(max_length + 3, 30)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        self._write_rows(ws, rows, widths, 30)
 
     def print_summary_report(self):
         """Print a comprehensive summary report of the medical camp"""
@@ -1181,127 +1396,92 @@ class MedicalCampDataEntry:
             print("\n📋 No data available for report.")
             return
 
-        print(f"\n" + "=" * 80)
-        print(f"        HASHIMUKH MEDICAL CAMP COMPREHENSIVE REPORT")
-        print("=" * 80)
-        print(f"📅 Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"👥 Total Patients Registered: {len(self.data)}")
+        stats = self._compute_summary()
+        n = stats.n
+
+        # Collect the report and write it to the terminal in one go
+        out = []
+        out.append(f"\n" + "=" * 80)
+        out.append(f"        HASHIMUKH MEDICAL CAMP COMPREHENSIVE REPORT")
+        out.append("=" * 80)
+        out.append(
+            f"📅 Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        )
+        out.append(f"👥 Total Patients Registered: {n}")
 
         # Gender statistics
-        male_count = sum(1 for p in self.data if p.get("Gender", "").lower() == "male")
-        female_count = len(self.data) - male_count
-        print(f"\n👫 GENDER DISTRIBUTION:")
-        print(f"   👨 Male: {male_count} ({male_count/len(self.data)*100:.1f}%)")
-        print(f"   👩 Female: {female_count} ({female_count/len(self.data)*100:.1f}%)")
+        out.append(f"\n👫 GENDER DISTRIBUTION:")
+        out.append(f"   👨 Male: {stats.male_count} ({stats.male_count/n*100:.1f}%)")
+        out.append(
+            f"   👩 Female: {stats.female_count} ({stats.female_count/n*100:.1f}%)"
+        )
 
         # Age statistics
-        ages = [int(p["Age"]) for p in self.data if str(p["Age"]).isdigit()]
+        ages = stats.ages
         if ages:
-            print(f"\n🎂 AGE STATISTICS:")
-            print(f"   📊 Age Range: {min(ages)} - {max(ages)} years")
-            print(f"   📈 Average Age: {sum(ages)/len(ages):.1f} years")
-            print(f"   📉 Median Age: {sorted(ages)[len(ages)//2]} years")
+            out.append(f"\n🎂 AGE STATISTICS:")
+            out.append(f"   📊 Age Range: {min(ages)} - {max(ages)} years")
+            out.append(f"   📈 Average Age: {sum(ages)/len(ages):.1f} years")
+            out.append(f"   📉 Median Age: {statistics.median_high(ages)} years")
 
         # Blood Group Distribution
-        blood_groups = {}
-        tested_for_blood_group = 0
-        for p in self.data:
-            bg = p.get("Blood Group", "").strip()
-            if bg:
-                blood_groups[bg] = blood_groups.get(bg, 0) + 1
-                tested_for_blood_group += 1
-
-        if blood_groups:
-            print(f"\n🩸 BLOOD GROUP DISTRIBUTION ({tested_for_blood_group} tested):")
-            for bg in sorted(blood_groups.keys()):
-                count = blood_groups[bg]
-                percentage = (count / tested_for_blood_group) * 100
-                print(f"   {bg}: {count} patients ({percentage:.1f}%)")
+        if stats.blood_groups:
+            out.append(
+                f"\n🩸 BLOOD GROUP DISTRIBUTION ({stats.tested_for_blood_group} tested):"
+            )
+            for bg in sorted(stats.blood_groups):
+                count = stats.blood_groups[bg]
+                percentage = (count / stats.tested_for_blood_group) * 100
+                out.append(f"   {bg}: {count} patients ({percentage:.1f}%)")
 
         # BMI Statistics
-        bmi_categories = {
-            "Severely Underweight": 0,
-            "Underweight": 0,
-            "Normal": 0,
-            "Overweight": 0,
-            "Obese Class I": 0,
-            "Obese Class II": 0,
-            "Obese Class III": 0,
-        }
-        measured_count = 0
-        bmi_values = []
 
-        for p in self.data:
-            if p.get("BMI", ""):
-                measured_count += 1
-                bmi_val = float(p["BMI"])
-                bmi_values.append(bmi_val)
-                bmi_cat = self.categorize_bmi(p["BMI"])
-                if bmi_cat in bmi_categories:
-                    bmi_categories[bmi_cat] += 1
-
-        if measured_count > 0:
-            print(f"\n📊 BMI DISTRIBUTION ({measured_count} measured):")
-            for category, count in bmi_categories.items():
+        if stats.measured_count > 0:
+            out.append(f"\n📊 BMI DISTRIBUTION ({stats.measured_count} measured):")
+            for category, count in zip(_BMI_LABELS, stats.bmi_counts):
                 if count > 0:
-                    percentage = (count / measured_count) * 100
-                    print(f"   {category}: {count} patients ({percentage:.1f}%)")
-            print(f"   📈 Average BMI: {sum(bmi_values)/len(bmi_values):.1f}")
-            print(f"   📉 BMI Range: {min(bmi_values):.1f} - {max(bmi_values):.1f}")
+                    percentage = (count / stats.measured_count) * 100
+                    out.append(f"   {category}: {count} patients ({percentage:.1f}%)")
+            out.append(
+                f"   📈 Average BMI: {sum(stats.bmi_values)/len(stats.bmi_values):.1f}"
+            )
+            out.append(
+                f"   📉 BMI Range: {min(stats.bmi_values):.1f} - {max(stats.bmi_values):.1f}"
+            )
 
         # Health Screening Coverage
-        sugar_tested = sum(1 for p in self.data if p.get("Blood Sugar", ""))
-        bp_tested = sum(1 for p in self.data if p.get("Blood Pressure", ""))
-        phone_provided = sum(1 for p in self.data if p.get("Phone", ""))
-
-        print(f"\n🩺 HEALTH SCREENING COVERAGE:")
-        print(
-            f"   🩸 Blood Group: {tested_for_blood_group}/{len(self.data)} ({tested_for_blood_group/len(self.data)*100:.1f}%)"
+        out.append(f"\n🩺 HEALTH SCREENING COVERAGE:")
+        out.append(
+            f"   🩸 Blood Group: {stats.tested_for_blood_group}/{n} ({stats.tested_for_blood_group/n*100:.1f}%)"
         )
-        print(
-            f"   🍯 Blood Sugar: {sugar_tested}/{len(self.data)} ({sugar_tested/len(self.data)*100:.1f}%)"
+        out.append(
+            f"   🍯 Blood Sugar: {stats.sugar_tested}/{n} ({stats.sugar_tested/n*100:.1f}%)"
         )
-        print(
-            f"   ❤️  Blood Pressure: {bp_tested}/{len(self.data)} ({bp_tested/len(self.data)*100:.1f}%)"
+        out.append(
+            f"   ❤️  Blood Pressure: {stats.bp_tested}/{n} ({stats.bp_tested/n*100:.1f}%)"
         )
-        print(
-            f"   📏 BMI Calculation: {measured_count}/{len(self.data)} ({measured_count/len(self.data)*100:.1f}%)"
+        out.append(
+            f"   📏 BMI Calculation: {stats.measured_count}/{n} ({stats.measured_count/n*100:.1f}%)"
         )
-        print(
-            f"   📱 Contact Info: {phone_provided}/{len(self.data)} ({phone_provided/len(self.data)*100:.1f}%)"
+        out.append(
+            f"   📱 Contact Info: {stats.phone_provided}/{n} ({stats.phone_provided/n*100:.1f}%)"
         )
 
         # Health Alert Summary
-        high_bp = sum(
-            1
-            for p in self.data
-            if "HIGH BP" in self.analyze_blood_pressure(p.get("Blood Pressure", ""))
-        )
-        high_sugar = sum(
-            1
-            for p in self.data
-            if "HIGH SUGAR" in self.analyze_blood_sugar(p.get("Blood Sugar", ""))
-        )
-        obese = sum(
-            1 for p in self.data if "OBESE" in self.analyze_bmi_health(p.get("BMI", ""))
-        )
-        crisis_bp = sum(
-            1
-            for p in self.data
-            if "CRISIS" in self.analyze_blood_pressure(p.get("Blood Pressure", ""))
-        )
-
-        print(f"\n🚨 HEALTH ALERT SUMMARY:")
-        print(f"   ❤️  High Blood Pressure: {high_bp} patients")
-        print(f"   🍯 High Blood Sugar: {high_sugar} patients")
-        print(f"   ⚖️  Obesity Cases: {obese} patients")
-        if crisis_bp > 0:
-            print(f"   🚨 CRITICAL - Hypertensive Crisis: {crisis_bp} patients")
-        print(
-            f"   📋 Total Requiring Follow-up: {high_bp + high_sugar + obese} patients"
+        out.append(f"\n🚨 HEALTH ALERT SUMMARY:")
+        out.append(f"   ❤️  High Blood Pressure: {stats.high_bp} patients")
+        out.append(f"   🍯 High Blood Sugar: {stats.high_sugar} patients")
+        out.append(f"   ⚖️  Obesity Cases: {stats.obese} patients")
+        if stats.crisis_bp > 0:
+            out.append(
+                f"   🚨 CRITICAL - Hypertensive Crisis: {stats.crisis_bp} patients"
+            )
+        out.append(
+            f"   📋 Total Requiring Follow-up: {stats.high_bp + stats.high_sugar + stats.obese} patients"
         )
 
-        print("=" * 80)
+        out.append("=" * 80)
+        sys.stdout.write("\n".join(out) + "\n")
 
     def run(self):
         print("=" * 60)